@@ -14,6 +14,7 @@ To run: python examples/advanced_usage.py [1-4]
 
 import sys
 import os
+import asyncio
 
 # Add the src directory to Python path for development
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
@@ -180,12 +181,25 @@ def example_multi_session() -> None:
 
         print(f'\n💬 Testing {len(sessions)} parallel sessions...')
 
-        for session_id, client in sessions:
+        async def ask_all_sessions() -> list:
+            # Sessions are independent, so their requests can run concurrently
+            return await asyncio.gather(
+                *(
+                    client.send_message_async(test_questions.get(session_id, 'Hello'))
+                    for session_id, client in sessions
+                ),
+                return_exceptions=True,
+            )
+
+        responses = asyncio.run(ask_all_sessions())
+
+        for (session_id, client), response in zip(sessions, responses):
             question = test_questions.get(session_id, 'Hello')
             print(f'\n📝 Session "{session_id}": {question}')
 
             try:
-                response = client.send_message(question)
+                if isinstance(response, Exception):
+                    raise response
                 if response:
                     display_response = (
                         response[:150] + '...' if len(response) > 150 else response
@@ -246,8 +260,9 @@ def example_error_handling():
     # Test 4: API client creation without configuration
     print('\n🧪 Test 4: Client creation without configuration')
     try:
-        fresh_manager = APIConnectionManager()
-        client = fresh_manager.create_chatclient()
+        # Reuse the same manager: reset() discards any previous configuration
+        api_manager.reset()
+        client = api_manager.create_chatclient()
         print('❌ Should have failed without configuration')
     except Exception as e:
         print(f'✅ Correctly caught error: {type(e).__name__}')
@@ -255,23 +270,23 @@ def example_error_handling():
     # Test 5: Recovery and successful operation
     print('\n🧪 Test 5: Recovery and successful operation')
     try:
-        recovery_manager = APIConnectionManager()
-        providers = recovery_manager.get_available_providers()
+        api_manager.reset()
+        providers = api_manager.get_available_providers()
 
         if providers:
             provider = providers[0]
-            configs = recovery_manager.get_provider_configs(provider)
-            apis = recovery_manager.get_supported_api(provider, 0)
+            configs = api_manager.get_provider_configs(provider)
+            apis = api_manager.get_supported_api(provider, 0)
 
             if apis:
                 api_type = apis[0]
-                recovery_manager.configure_api(provider, 0, api_type)
+                api_manager.configure_api(provider, 0, api_type)
 
-                if recovery_manager.validate_configuration():
+                if api_manager.validate_configuration():
                     print('✅ Successfully recovered and configured')
 
                     # Test a simple operation
-                    with recovery_manager.create_chatclient() as client:
+                    with api_manager.create_chatclient() as client:
                         if client.get_connection_status():
                             print('✅ Client created and connected successfully')
                         else:
@@ -37,24 +37,27 @@ def main() -> None:
         providers = manager.get_available_providers()
         print(f'Available providers: {providers}')
 
-        # Look for HuggingFace or other REST-compatible provider
-        rest_provider = None
-        for provider in providers:
-            try:
-                configs = manager.get_provider_configs(provider)
-                if configs:
-                    supported_apis = manager.get_supported_api(provider, 0)
-                    if 'requests' in supported_apis or 'rest' in supported_apis:
-                        rest_provider = provider
-                        print(f'Found REST-compatible provider: {provider}')
-                        break
-            except Exception:
-                continue
-
-        if not rest_provider:
+        # Providers listed without any configuration cannot be used
+        configured = [
+            provider for provider in providers if manager.get_provider_configs(provider)
+        ]
+
+        # Look for the first provider whose default config supports REST
+        rest_provider = next(
+            (
+                provider
+                for provider in configured
+                if 'requests' in manager.get_supported_api(provider, 0)
+            ),
+            None,
+        )
+
+        if rest_provider:
+            print(f'Found REST-compatible provider: {rest_provider}')
+        else:
             print('⚠️  No REST-compatible providers found in configuration.')
             print('Falling back to OpenAI-compatible provider for demonstration...')
-            rest_provider = providers[0] if providers else 'OPENROUTER'
+            rest_provider = configured[0] if configured else 'OPENROUTER'
 
         # Configure the REST connection
         print(f'Configuring connection to {rest_provider}...')
@@ -116,7 +119,9 @@ def main() -> None:
                         # Show response length and first part
                         response_length = len(response)
                         display_response = (
-                            response[:250] + '...' if len(response) > 250 else response
+                            response[:250] + '...'
+                            if response_length > 250
+                            else response
                         )
                         print(
                             f'🤖 Response ({response_length} chars): {display_response}'
@@ -24,10 +24,22 @@ Usage:
         print(response)
 '''
 
-# Import the classes we want to expose
-from .api_connection import APIConnectionManager
-from .compatible_client_api import BaseAPIClient, OpenAICompatibleClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .api_connection import APIConnectionManager
+    from .compatible_client_api import BaseAPIClient, OpenAICompatibleClient
+
+
+# Public classes and the submodule they are imported from on first access.
+# Deferring these imports keeps `import unified_ai_api.types` (and the other
+# submodules) from pulling in openai, httpx and requests.
+_LAZY_EXPORTS = {
+    'APIConnectionManager': '.api_connection',
+    'BaseAPIClient': '.compatible_client_api',
+    'OpenAICompatibleClient': '.compatible_client_api',
+}
 
 # Explicitly define what gets exported
 __all__ = [
@@ -36,6 +48,21 @@ __all__ = [
     'OpenAICompatibleClient',
 ]
 
+
+def __getattr__(name: str) -> Any:
+    '''Import public classes on first access (PEP 562).'''
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+    '''Include lazily imported classes in dir() output.'''
+    return sorted(set(globals()) | set(__all__))
+
+
 # Version information
 __version__ = '1.0.0'
 __author__ = 'API_AI Team'
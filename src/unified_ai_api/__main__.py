@@ -3,41 +3,82 @@ Entry point for running unified_ai_api as a module: python -m unified_ai_api
 """
 
 import sys
-from typing import Optional
+import argparse
+from typing import Optional, Sequence
 
-def main() -> Optional[int]:
+
+_BANNER = (
+    '🤖 Unified AI API Connection Manager\n'
+    + '=' * 40
+    + '\nWelcome! This will guide you through setting up your AI connection.\n'
+)
+
+_TROUBLESHOOTING = (
+    '\n🔧 Troubleshooting:\n'
+    '1. Check your API key configuration\n'
+    '2. Verify configuration files in src/unified_ai_api/config/\n'
+    '3. Make sure dependencies are installed'
+)
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments using only the standard library."""
+    from unified_ai_api import __description__, __version__
+
+    parser = argparse.ArgumentParser(
+        prog='unified-ai-api',
+        description=f'{__description__}. Starts an interactive chat session.',
+    )
+    parser.add_argument(
+        '--version', action='version', version=f'%(prog)s {__version__}'
+    )
+    return parser.parse_args(argv)
+
+
+def _enable_line_editing() -> None:
+    """Give input() prompts arrow-key editing and in-session history."""
+    try:
+        import readline  # noqa: F401  # importing is enough to hook input()
+    except ImportError:
+        pass  # Not available on every platform (e.g. plain Windows builds)
+
+
+def _run_interactive() -> int:
+    """Run the interactive setup wizard followed by a chat session."""
+    # Import here so that --help/--version never load the API clients
+    from unified_ai_api.api_connection import APIConnectionManager
+
+    _enable_line_editing()
+    print(_BANNER)
+
+    # Initialize the API connection manager
+    api_manager = APIConnectionManager()
+
+    # Start interactive setup
+    if api_manager.interactive_setup():
+        print('\n🚀 Starting chat session...')
+        api_manager.start_chat_loop()
+    else:
+        print('\n❌ Setup failed. Please check your configuration and try again.')
+        return 1
+
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Optional[int]:
     """Main entry point for the unified-ai-api CLI."""
+    _parse_args(argv)
+
     try:
-        # Import here to avoid circular imports
-        from unified_ai_api.api_connection import APIConnectionManager
-        
-        print('🤖 Unified AI API Connection Manager')
-        print('=' * 40)
-        print('Welcome! This will guide you through setting up your AI connection.\n')
-        
-        # Initialize the API connection manager
-        api_manager = APIConnectionManager()
-        
-        # Start interactive setup
-        if api_manager.interactive_setup():
-            print('\n🚀 Starting chat session...')
-            api_manager.start_chat_loop()
-        else:
-            print('\n❌ Setup failed. Please check your configuration and try again.')
-            return 1
-            
-        return 0
-        
+        return _run_interactive()
+
     except KeyboardInterrupt:
         print('\n\n✅ Thanks for using Unified AI API! Goodbye!')
         return 0
     except Exception as e:
         print(f'\n❌ Error: {e}')
-        print('\n🔧 Troubleshooting:')
-        print('1. Check your API key configuration')
-        print('2. Verify configuration files in src/unified_ai_api/config/')
-        print('3. Make sure dependencies are installed')
+        print(_TROUBLESHOOTING)
         return 1
 
 if __name__ == '__main__':
-    sys.exit(main() or 0)
\ No newline at end of file
+    sys.exit(main() or 0)
@@ -5,13 +5,20 @@ This module provides functions for loading and caching configuration files
 with proper error handling and type safety.
 '''
 
+import os
 import json
-from typing import cast
-from functools import lru_cache
+from typing import Any, cast
+from pathlib import Path
 
 from ..config import DEFAULTS_FILE_PATH, PROVIDER_FILE_PATH, SECRET_FILE_PATH
 from ..types import ProvidersFile, SecretsConfig, DefaultsConfig
 
+try:
+    # Optional faster JSON parser, installed with the 'fast' extra
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 __all__ = [
     'load_providers_file',
@@ -21,7 +28,42 @@ __all__ = [
 ]
 
 
-@lru_cache(maxsize=1)
+# Parsed configuration files keyed by path: (st_mtime_ns, st_size, data)
+_CACHE: dict[Path, tuple[int, int, Any]] = {}
+
+
+def _load_json_cached(path: Path, label: str) -> Any:
+    '''
+    Load a JSON file, reusing the parsed data while the file is unchanged.
+
+    The cache entry is invalidated when the file modification time or size
+    differs from the values recorded at parse time.
+
+    Args:
+        path: Path of the JSON file to load
+        label: Human readable name used in error messages
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        ValueError: If file is missing or contains invalid JSON
+    '''
+    try:
+        stat = os.stat(path)
+        cached = _CACHE.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        data = _json_loads(path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        _CACHE.pop(path, None)
+        raise ValueError(f'Failed to load {label} from {path}: {e}') from e
+
+    _CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
 def load_providers_file() -> ProvidersFile:
     '''
     Load and cache provider configuration from JSON file.
@@ -32,16 +74,9 @@ def load_providers_file() -> ProvidersFile:
     Raises:
         ValueError: If file is missing or contains invalid JSON
     '''
-    try:
-        with open(PROVIDER_FILE_PATH, 'r', encoding='utf-8') as f:
-            return cast(ProvidersFile, json.load(f))
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        raise ValueError(
-            f'Failed to load provider config from {PROVIDER_FILE_PATH}: {e}'
-        ) from e
+    return cast(ProvidersFile, _load_json_cached(PROVIDER_FILE_PATH, 'provider config'))
 
 
-@lru_cache(maxsize=1)
 def load_secrets_config() -> SecretsConfig:
     '''
     Load and cache secrets configuration from JSON file.
@@ -52,16 +87,9 @@ def load_secrets_config() -> SecretsConfig:
     Raises:
         ValueError: If file is missing or contains invalid JSON
     '''
-    try:
-        with open(SECRET_FILE_PATH, 'r', encoding='utf-8') as f:
-            return cast(SecretsConfig, json.load(f))
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        raise ValueError(
-            f'Failed to load secrets config from {SECRET_FILE_PATH}: {e}'
-        ) from e
+    return cast(SecretsConfig, _load_json_cached(SECRET_FILE_PATH, 'secrets config'))
 
 
-@lru_cache(maxsize=1)
 def load_defaults_config() -> DefaultsConfig:
     '''
     Load and cache default configuration from JSON file.
@@ -72,22 +100,16 @@ def load_defaults_config() -> DefaultsConfig:
     Raises:
         ValueError: If file is missing or contains invalid JSON
     '''
-    try:
-        with open(DEFAULTS_FILE_PATH, 'r', encoding='utf-8') as f:
-            return cast(DefaultsConfig, json.load(f))
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        raise ValueError(
-            f'Failed to load defaults config from {DEFAULTS_FILE_PATH}: {e}'
-        ) from e
+    return cast(
+        DefaultsConfig, _load_json_cached(DEFAULTS_FILE_PATH, 'defaults config')
+    )
 
 
 def clear_config_cache() -> None:
     '''
     Clear all configuration caches.
 
-    This is useful for testing or when configuration files are updated
-    and you need to reload them.
+    Cached entries are refreshed automatically when a file changes on disk;
+    this is useful for testing or to force a reload regardless.
     '''
-    load_providers_file.cache_clear()
-    load_secrets_config.cache_clear()
-    load_defaults_config.cache_clear()
+    _CACHE.clear()
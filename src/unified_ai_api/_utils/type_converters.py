@@ -15,6 +15,9 @@ from ..types import (
     ApiEndpoints,
 )
 
+# Required field names as a set for a single C-level subset check
+_REQUIRED_FIELDS: frozenset[str] = frozenset(PROVIDER_ATTRIBUTES)
+
 __all__ = [
     'filter_providers_by_api_type',
     'extract_supported_apis',
@@ -57,13 +60,14 @@ def extract_supported_apis(providers: ProvidersFile) -> set[ApiSupportedContent]
     Returns:
         Set of all supported API types
     '''
-    supported_apis: set[ApiSupportedContent] = set()
-
-    for configs in providers.values():
-        for config in configs:
-            supported_apis.update(config['api_supported'])
-
-    return supported_apis
+    # Single C-level union over every config's api_supported list
+    return set().union(
+        *(
+            config['api_supported']
+            for configs in providers.values()
+            for config in configs
+        )
+    )
 
 
 def validate_provider_config_fields(config: ProvidersConfigParams) -> bool:
@@ -78,15 +82,15 @@ def validate_provider_config_fields(config: ProvidersConfigParams) -> bool:
         True if all required fields are present and non-empty
     '''
     # Use the constant derived from the type - single source of truth
-    for field in PROVIDER_ATTRIBUTES:
-        if field not in config:
-            return False
+    if not _REQUIRED_FIELDS.issubset(config):
+        return False
 
-        # Check for non-empty values
+    # Check for non-empty values (empty str, list and dict are all falsy)
+    for field in PROVIDER_ATTRIBUTES:
         value: str | ApiSupported | ApiEndpoints = config[field]
-        if isinstance(value, str) and not value.strip():
-            return False
-        elif isinstance(value, (list, dict)) and not value:
+        if isinstance(value, str):
+            value = value.strip()
+        if not value:
             return False
 
     return True
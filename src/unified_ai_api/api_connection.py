@@ -26,8 +26,13 @@ Usage:
             manager.start_chat_loop()
 """
 
-import secrets
-from typing import Any
+import asyncio
+import functools
+import logging
+import threading
+import weakref
+from collections import OrderedDict, deque
+from typing import Any, Callable, Iterator, TypeVar
 
 from .types import (
     ApiSupportedContent,
@@ -51,21 +56,46 @@ from .compatible_client_api import (
 from .providers_config_handlers import ProvidersConfigHandler
 from .auth_keys import get_secret_api_key
 
+logger = logging.getLogger(__name__)
+
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+
+def _requires_connection(method: _F) -> _F:
+    """Make a ChatClient method raise unless the client is open and connected.
+
+    Args:
+        method: ChatClient method to guard
+
+    Returns:
+        The wrapped method, raising APIClientError if no connection is
+        established or the client has been closed
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: 'ChatClient', *args: Any, **kwargs: Any) -> Any:
+        if self.compatible_client is None:
+            raise APIClientError(
+                'No API connection established. '
+                'Use APIConnectionManager.create_chatclient() first.'
+            )
+        if self._is_closed:
+            raise APIClientError(f"ChatClient session '{self._session_id}' is closed")
+        return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class _ChatClientToken:
     """Private security token to control ChatClient instantiation.
 
     This token ensures that ChatClient instances can only be created through
     the APIConnectionManager factory method, preventing direct instantiation
-    and maintaining proper initialization flow.
-
-    Attributes:
-        _token (str): Cryptographically secure random token
+    and maintaining proper initialization flow. Only the token's type is
+    checked, so it carries no state.
     """
 
-    def __init__(self) -> None:
-        """Initialize a new security token."""
-        self._token = secrets.token_hex(16)
+    __slots__ = ()
 
 
 class ChatClient:
@@ -80,7 +110,8 @@ class ChatClient:
         to ensure proper configuration and resource management.
 
     Features:
-        - Automatic chat history management
+        - Automatic chat history management (optionally bounded)
+        - Optional response cache for repeated identical conversations
         - Message formatting and validation
         - Context manager support for resource cleanup
         - Configurable timeouts and error handling
@@ -97,12 +128,44 @@ class ChatClient:
             print(response)
     """
 
+    # __weakref__ keeps clients trackable by APIConnectionManager's WeakSet
+    __slots__ = (
+        '_token',
+        '_session_id',
+        '_is_closed',
+        '_secret_api_key',
+        '_connection_params',
+        '_chat_history',
+        '_max_history',
+        '_cache_responses',
+        '_init_message',
+        'compatible_client',
+        '__weakref__',
+    )
+
+    # Connection parameters every client needs, in the order they are reported
+    _REQUIRED_PARAMS: tuple[str, ...] = (
+        'api_type',
+        'endpoint_url',
+        'model_name',
+        'init_config_msg',
+    )
+
+    # Responses shared by all clients created with cache_responses=True, keyed
+    # by connection and the exact conversation sent. Least recently used
+    # entries are evicted first.
+    _RESPONSE_CACHE_SIZE: int = 256
+    _response_cache: OrderedDict[tuple, str] = OrderedDict()
+    _response_cache_lock = threading.Lock()
+
     def __init__(
         self,
         token: _ChatClientToken,
         session_id: str,
         connection_params: dict[str, Any],
         secret_api_key: str,
+        max_history: int | None = None,
+        cache_responses: bool = False,
     ) -> None:
         """Initialize a ChatClient instance.
 
@@ -111,6 +174,13 @@ class ChatClient:
             session_id: Unique identifier for this chat session
             connection_params: Configuration parameters for the connection
             secret_api_key: API authentication key
+            max_history: Maximum number of messages kept in the chat history,
+                        not counting the initial message, which always stays.
+                        Must be at least 2 so one user/assistant exchange
+                        fits. The oldest exchanges are discarded first.
+                        None keeps all.
+            cache_responses: Reuse the stored response when the exact same
+                            conversation was already sent to the same model.
 
         Raises:
             RuntimeError: If not called through APIConnectionManager
@@ -130,11 +200,15 @@ class ChatClient:
             raise InvalidParameterError("Secret API key must be provided and non-empty")
         if not session_id or not session_id.strip():
             raise InvalidParameterError("Session ID must be provided and non-empty")
+        if max_history is not None and max_history < 2:
+            raise InvalidParameterError(
+                "max_history must be at least 2 so one exchange fits, "
+                f"got: {max_history}"
+            )
 
         # Validate required connection parameters
-        required_params = ['api_type', 'endpoint_url', 'model_name', 'init_config_msg']
         missing_params = [
-            param for param in required_params if param not in connection_params
+            param for param in self._REQUIRED_PARAMS if param not in connection_params
         ]
         if missing_params:
             raise InvalidParameterError(
@@ -142,11 +216,11 @@ class ChatClient:
             )
 
         # Validate parameter values are not empty
-        empty_params = [
-            param
-            for param in required_params
-            if not connection_params[param] or not str(connection_params[param]).strip()
-        ]
+        empty_params = []
+        for param in self._REQUIRED_PARAMS:
+            value = connection_params[param]
+            if not value or not str(value).strip():
+                empty_params.append(param)
         if empty_params:
             raise InvalidParameterError(
                 f"Empty values for required parameters: {empty_params}"
@@ -158,7 +232,15 @@ class ChatClient:
         self._is_closed = False
         self._secret_api_key: str = secret_api_key
         self._connection_params: dict[str, Any] = connection_params
-        self._chat_history: list[ChatMessage] = []
+        self._chat_history: deque[ChatMessage] = deque()
+        self._max_history: int | None = max_history
+        self._cache_responses: bool = cache_responses
+
+        # Built once and reused every time the history is reset; the value is
+        # known to be non-empty from the validation above
+        self._init_message: ChatMessage = self._create_message_user(
+            connection_params['init_config_msg']
+        )
 
         # Try to initialize CompatibleClient with proper error handling
         try:
@@ -216,6 +298,68 @@ class ChatClient:
 
         return assistant_message
 
+    def _append_history(self, message: ChatMessage) -> None:
+        """Add a message to the chat history, enforcing max_history.
+
+        The initial message stays pinned at the front. Older messages are
+        dropped a whole user/assistant exchange at a time, so the history
+        never starts with an orphaned assistant reply, which chat templates
+        that require alternating roles reject.
+
+        Args:
+            message: Message to append
+        """
+        history = self._chat_history
+        history.append(message)
+        if self._max_history is None:
+            return
+
+        start = 1 if history and history[0] is self._init_message else 0
+        while len(history) - start > self._max_history:
+            del history[start]
+            # Drop the reply together with the user message it answered
+            while len(history) > start and history[start].role != 'user':
+                del history[start]
+
+    def _response_cache_key(self) -> tuple | None:
+        """Build the response cache key for the current chat history.
+
+        Returns:
+            tuple | None: Key identifying the model and conversation, or None
+                         if response caching is disabled for this client
+        """
+        if not self._cache_responses:
+            return None
+        return (
+            self._connection_params['api_type'],
+            self._connection_params['endpoint_url'],
+            self._connection_params['model_name'],
+            tuple((msg.role, msg.content) for msg in self._chat_history),
+        )
+
+    def _get_cached_response(self, key: tuple) -> str | None:
+        """Return the cached response for key, if any."""
+        with self._response_cache_lock:
+            content = self._response_cache.get(key)
+            if content is not None:
+                self._response_cache.move_to_end(key)
+            return content
+
+    def _store_cached_response(self, key: tuple, content: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._response_cache_lock:
+            self._response_cache[key] = content
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self._RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    @classmethod
+    def clear_response_cache(cls) -> None:
+        """Discard all cached responses shared by ChatClient instances."""
+        with cls._response_cache_lock:
+            cls._response_cache.clear()
+
+    @_requires_connection
     def send_message(self, message: str) -> str | None:
         """Send a message to the AI and get a response.
 
@@ -233,7 +377,8 @@ class ChatClient:
 
         Raises:
             InvalidParameterError: If message is empty or None
-            APIClientError: If no client connection is established
+            APIClientError: If no client connection is established or the
+                           client has been closed
 
         Note:
             API errors (network issues, rate limits, etc.) return None rather
@@ -243,28 +388,33 @@ class ChatClient:
         if not message or not message.strip():
             raise InvalidParameterError("Message cannot be empty or None")
 
-        # Check if client is available
-        if self.compatible_client is None:
-            raise APIClientError('API connection not established')
-
         try:
             # Create user message
             user_message: ChatMessage = self._create_message_user(message=message)
             # Add to chat history
-            self._chat_history.append(user_message)
+            self._append_history(user_message)
 
-            # Get response from API
-            response: ChatCompletionResponse = self.compatible_client.chat_completion(
-                self._chat_history
+            # Reuse a cached response for an identical conversation if enabled
+            cache_key = self._response_cache_key()
+            response_content = (
+                self._get_cached_response(cache_key) if cache_key else None
             )
-            response_content = response.get_content()
+
+            if response_content is None:
+                # Get response from API
+                response: ChatCompletionResponse = (
+                    self.compatible_client.chat_completion(self._chat_history)
+                )
+                response_content = response.get_content()
+                if cache_key and response_content:
+                    self._store_cached_response(cache_key, response_content)
 
             # Add assistant response to history (if we want to maintain conversation)
             if response_content:
                 assistant_message: ChatMessage = ChatMessage.create_message(
                     role='assistant', content=response_content
                 )
-                self._chat_history.append(assistant_message)
+                self._append_history(assistant_message)
 
             return response_content
 
@@ -275,13 +425,113 @@ class ChatClient:
             ResponseConversionError,
         ) as e:
             # Log API-specific errors but don't re-raise, return None to indicate failure
-            print(f'API error sending message: {e}')
+            logger.warning('API error sending message: %s', e)
             return None
         except Exception as e:
             # Log unexpected errors
-            print(f'Unexpected error sending message: {e}')
+            logger.exception('Unexpected error sending message: %s', e)
             return None
 
+    async def send_message_async(self, message: str) -> str | None:
+        """Send a message to the AI without blocking the event loop.
+
+        Runs send_message() in a worker thread so that several clients can
+        wait on their providers concurrently, e.g. with asyncio.gather().
+
+        Args:
+            message: The message to send (must be non-empty)
+
+        Returns:
+            str | None: The AI response content, or None if an error occurred
+                       (same semantics as send_message()).
+
+        Raises:
+            InvalidParameterError: If message is empty or None
+            APIClientError: If no client connection is established or the
+                           client has been closed
+
+        Note:
+            Each call updates this client's chat history. Await one call at a
+            time per client; use separate clients for concurrent conversations.
+        """
+        return await asyncio.to_thread(self.send_message, message)
+
+    @_requires_connection
+    def iter_message(self, message: str) -> Iterator[str]:
+        """Send a message to the AI and yield the response as it arrives.
+
+        Streaming counterpart of send_message(): the caller can start using
+        the first pieces of the answer while the rest is still being
+        generated. The full response is added to the chat history once the
+        iterator is exhausted.
+
+        Args:
+            message: The message to send (must be non-empty)
+
+        Returns:
+            Iterator[str]: Successive pieces of the AI response
+
+        Raises:
+            InvalidParameterError: If message is empty or None
+            APIClientError: If no client connection is established, or (while
+                           iterating) if the provider request fails
+
+        Note:
+            Unlike send_message(), API errors are raised rather than returned
+            as None. If iteration stops early, the partial response is not
+            recorded in the chat history.
+
+        Example:
+            for chunk in client.iter_message("Tell me a story"):
+                print(chunk, end="", flush=True)
+        """
+        # Validate eagerly so errors surface at the call, not on first next()
+        if not message or not message.strip():
+            raise InvalidParameterError("Message cannot be empty or None")
+
+        self._append_history(self._create_message_user(message=message))
+        return self._stream_response()
+
+    def _stream_response(self) -> Iterator[str]:
+        """Yield the response for the current chat history and record it.
+
+        Yields:
+            str: Successive pieces of the AI response
+
+        Raises:
+            APIClientError: If the provider request fails
+        """
+        parts: list[str] = []
+        cache_key = self._response_cache_key()
+        cached = self._get_cached_response(cache_key) if cache_key else None
+
+        if cached is not None:
+            parts.append(cached)
+            yield cached
+        else:
+            try:
+                for chunk in self.compatible_client.chat_completion_stream(
+                    self._chat_history
+                ):
+                    parts.append(chunk)
+                    yield chunk
+            except APIClientError:
+                raise
+            except Exception as e:
+                raise APIClientError(f"Failed to stream response: {e}") from e
+
+        response_content = ''.join(parts)
+        if response_content:
+            if cache_key and cached is None:
+                self._store_cached_response(cache_key, response_content)
+            self._append_history(
+                ChatMessage.create_message(role='assistant', content=response_content)
+            )
+        else:
+            # Surface it rather than hiding a provider-side streaming problem
+            logger.warning('Provider streamed an empty response')
+
+    @_requires_connection
     def clear_chat_history(self) -> None:
         """Clear conversation history and reset to initial state.
 
@@ -290,27 +540,11 @@ class ChatClient:
         a fresh conversation while maintaining the same connection.
 
         Raises:
-            APIClientError: If no client connection is established or
-                           if required configuration is missing
+            APIClientError: If no client connection is established or the
+                           client has been closed
         """
-        if self.compatible_client is None:
-            raise APIClientError('No API connection established')
-
-        try:
-            init_config_text_msg: str = self._connection_params['init_config_msg']
-            if not init_config_text_msg:
-                # Use a default message if none configured
-                init_config_text_msg = "You are a helpful AI assistant."
-
-            init_config_chat_msg: ChatMessage = self._create_message_user(
-                init_config_text_msg
-            )
-            self._chat_history = [init_config_chat_msg]
-
-        except KeyError as e:
-            raise APIClientError(f"Missing configuration parameter: {e}") from e
-        except Exception as e:
-            raise APIClientError(f"Failed to clear chat history: {e}") from e
+        self._chat_history.clear()
+        self._chat_history.append(self._init_message)
 
     def get_connection_status(self) -> bool:
         """Check if the client has an active connection.
@@ -320,6 +554,7 @@ class ChatClient:
         """
         return self.compatible_client is not None
 
+    @_requires_connection
     def get_model_name(self) -> str:
         """Get model name.
 
@@ -327,14 +562,12 @@ class ChatClient:
             str: The configured model name
 
         Raises:
-            APIClientError: If no client connection is established
+            APIClientError: If no client connection is established or the
+                           client has been closed
         """
-        if self.compatible_client is None:
-            raise APIClientError(
-                'No API connection established. Use APIConnectionManager.create_chatclient() first.'
-            )
         return self._connection_params['model_name']
 
+    @_requires_connection
     def get_connection_params(self) -> dict[str, Any]:
         """Get connection parameters.
 
@@ -342,12 +575,9 @@ class ChatClient:
             dict: Copy of connection parameters
 
         Raises:
-            APIClientError: If no client connection is established
+            APIClientError: If no client connection is established or the
+                           client has been closed
         """
-        if self.compatible_client is None:
-            raise APIClientError(
-                'No API connection established. Use APIConnectionManager.create_chatclient() first.'
-            )
         return (
             self._connection_params.copy()
         )  # Return copy to prevent external modification
@@ -367,7 +597,7 @@ class ChatClient:
             if self.compatible_client:
                 self.compatible_client.close()  # Call compatible client's cleanup
             self._chat_history.clear()  # Clear memory
-            print(f"Closing ChatClient session: {self._session_id}")
+            logger.debug('Closing ChatClient session: %s', self._session_id)
             self._is_closed = True
 
     def __enter__(self) -> 'ChatClient':
@@ -429,13 +659,22 @@ class APIConnectionManager:
                      .create_chatclient())
     """
 
+    # Parameters configure_api() must have set before clients can be created
+    _REQUIRED_CONFIG: tuple[str, ...] = (
+        'provider',
+        'config_index',
+        *ChatClient._REQUIRED_PARAMS,
+    )
+
     def __init__(self) -> None:
         """Initialize a new API connection manager.
 
         Creates an empty manager ready for configuration. No connections
         are established until configure_api() is called.
         """
-        self._active_clients: list['ChatClient'] = []
+        # Clients drop out automatically once they are garbage collected
+        self._active_clients: weakref.WeakSet[ChatClient] = weakref.WeakSet()
+        self._session_counter: int = 0
         self._connection_params: dict = {}
 
     def configure_api(
@@ -486,37 +725,39 @@ class APIConnectionManager:
                     f"(max: {len(provider_configs) - 1})"
                 )
 
+            # Read everything else from this single configuration entry
+            provider_config = provider_configs[config_index]
+
             # Validate API type is supported
-            supported_apis = ProvidersConfigHandler.get_provider_api_supported(
-                provider, config_index
-            )
+            supported_apis = provider_config.get('api_supported', [])
             if api_type not in supported_apis:
                 raise InvalidParameterError(
                     f"API type '{api_type}' not supported by provider '{provider}' config {config_index}. "
                     f"Supported: {supported_apis}"
                 )
 
+            endpoints = provider_config['api_endpoints']
+            if api_type not in endpoints:
+                raise InvalidParameterError(
+                    f"No '{api_type}' endpoint configured for provider '{provider}' "
+                    f"config {config_index}. Available: {list(endpoints)}"
+                )
+
             # Get configuration parameters
             self._connection_params.update(
                 {
                     'provider': provider,
                     'config_index': config_index,
                     'api_type': api_type,
-                    'endpoint_url': ProvidersConfigHandler.get_provider_endpoint(
-                        provider, api_type, config_index
-                    ),
-                    'model_name': ProvidersConfigHandler.get_provider_config_attribute(
-                        provider, 'model_name', config_index
-                    ),
-                    'init_config_msg': ProvidersConfigHandler.get_provider_config_attribute(
-                        provider, 'init_config_msg', config_index
-                    ),
+                    'endpoint_url': endpoints[api_type],
+                    'model_name': str(provider_config['model_name']),
+                    'init_config_msg': str(provider_config['init_config_msg']),
                 }
             )
 
             # Get secret API key
             self._secret_api_key = get_secret_api_key(
-                provider, config_index=config_index
+                provider, config_name=str(provider_config['config_name'])
             )
 
             # Validate that we got a non-empty API key
@@ -546,17 +787,9 @@ class APIConnectionManager:
         Returns:
             bool: True if configuration is complete and valid, False otherwise
         """
-        required = [
-            'provider',
-            'config_index',
-            'api_type',
-            'endpoint_url',
-            'model_name',
-            'init_config_msg',
-        ]
-        return all(param in self._connection_params for param in required) and hasattr(
-            self, '_secret_api_key'
-        )
+        return all(
+            param in self._connection_params for param in self._REQUIRED_CONFIG
+        ) and hasattr(self, '_secret_api_key')
 
     def get_connection_params(self) -> dict[str, Any]:
         """Get information about the configured connection.
@@ -573,7 +806,12 @@ class APIConnectionManager:
             'init_config_msg': self._connection_params.get('init_config_msg', ''),
         }
 
-    def create_chatclient(self, session_id: str | None = None) -> ChatClient:
+    def create_chatclient(
+        self,
+        session_id: str | None = None,
+        max_history: int | None = None,
+        cache_responses: bool = False,
+    ) -> ChatClient:
         """Create a new ChatClient instance (factory method).
 
         This is the only way to create ChatClient instances. The factory
@@ -582,12 +820,20 @@ class APIConnectionManager:
         Args:
             session_id: Optional session identifier. If None, auto-generated
                        based on the number of active clients.
+            max_history: Optional cap on the number of messages kept in the
+                        client's chat history, besides the pinned initial
+                        message. Must be at least 2 (one exchange). If None,
+                        history is unbounded.
+            cache_responses: If True, identical conversations sent to the same
+                            model are answered from a shared in-memory cache
+                            instead of calling the provider again.
 
         Returns:
             ChatClient: Configured and ready-to-use chat client instance
 
         Raises:
-            InvalidParameterError: If configuration is incomplete or session_id is empty
+            InvalidParameterError: If configuration is incomplete, session_id is empty
+                                   or max_history is below 2
             APIClientError: If client creation fails due to initialization errors
 
         Note:
@@ -595,18 +841,11 @@ class APIConnectionManager:
             Use close_all_clients() to clean up all active sessions.
         """
         if not self.validate_configuration():
-            missing_config = []
-            required = [
-                'provider',
-                'config_index',
-                'api_type',
-                'endpoint_url',
-                'model_name',
-                'init_config_msg',
+            missing_config = [
+                param
+                for param in self._REQUIRED_CONFIG
+                if param not in self._connection_params
             ]
-            for param in required:
-                if param not in self._connection_params:
-                    missing_config.append(param)
             if not hasattr(self, '_secret_api_key'):
                 missing_config.append('secret_api_key')
 
@@ -618,7 +857,8 @@ class APIConnectionManager:
         try:
             # Generate session ID if not provided
             if session_id is None:
-                session_id = f'session_{len(self._active_clients)}'
+                session_id = f'session_{self._session_counter}'
+                self._session_counter += 1
             elif not session_id.strip():
                 raise InvalidParameterError("Session ID cannot be empty")
 
@@ -631,10 +871,12 @@ class APIConnectionManager:
                 connection_params=self._connection_params.copy(),
                 session_id=session_id,
                 secret_api_key=self._secret_api_key,
+                max_history=max_history,
+                cache_responses=cache_responses,
             )
 
             # Track active clients for cleanup
-            self._active_clients.append(client)
+            self._active_clients.add(client)
             return client
 
         except (InvalidParameterError, APIClientError, UnsupportedAPITypeError):
@@ -649,13 +891,29 @@ class APIConnectionManager:
     def close_all_clients(self) -> None:
         """Close and cleanup all active chat clients.
 
-        Calls close() on all clients created by this manager and clears
-        the internal tracking list. Safe to call multiple times.
+        Calls close() on all clients created by this manager that are still
+        alive and clears the internal tracking set. Safe to call multiple times.
         """
-        for client in self._active_clients:
+        for client in list(self._active_clients):
             client.close()
         self._active_clients.clear()
 
+    def reset(self) -> 'APIConnectionManager':
+        """Return the manager to its unconfigured state.
+
+        Closes all active clients and discards the connection parameters and
+        API key, so the same instance can be configured again without
+        creating a new manager.
+
+        Returns:
+            APIConnectionManager: Self for method chaining
+        """
+        self.close_all_clients()
+        self._connection_params.clear()
+        if hasattr(self, '_secret_api_key'):
+            del self._secret_api_key
+        return self
+
     # Provider configuration helpers - delegate to ProvidersConfigHandler
     def get_available_providers(self) -> list[ProviderName]:
         """Get list of all available AI providers.
@@ -791,12 +1049,13 @@ class APIConnectionManager:
         """Start an interactive chat session in the terminal.
 
         Creates a chat client and enters a loop where users can type messages
-        and receive AI responses. The loop continues until the user presses Ctrl+C.
+        and receive AI responses. The loop continues until the user presses Ctrl+C
+        or standard input reaches end of file.
 
         Features:
             - Real-time conversation with the configured AI
             - Automatic client cleanup on exit
-            - Graceful handling of Ctrl+C interruption
+            - Graceful handling of Ctrl+C interruption and end of input
             - Error reporting for failed responses
 
         Raises:
@@ -813,26 +1072,44 @@ class APIConnectionManager:
             )
 
         try:
-            chat_client = self.create_chatclient()
-            print(
-                f'\nChat started with {self.get_connection_params()['provider']} - {chat_client.get_model_name()}'
-            )
-            print('Press Ctrl+C to exit\n')
-
-            try:
-                while True:
-                    user_input = input('You: ')
-                    if user_input.strip():
-                        response = chat_client.send_message(user_input)
-                        if response:
-                            print(f'AI: {response}\n')
-                        else:
-                            print('Error getting response\n')
-            except KeyboardInterrupt:
-                print('\nGoodbye!\n')
-            finally:
-                # Clean up the chat client
-                chat_client.close()
-
+            # The context manager closes the chat client on exit
+            with self.create_chatclient() as chat_client:
+                print(
+                    f'\nChat started with {self.get_connection_params()['provider']} - {chat_client.get_model_name()}'
+                )
+                print('Press Ctrl+C to exit\n')
+
+                try:
+                    while True:
+                        user_input = input('You: ')
+                        if user_input.strip():
+                            self._print_streamed_response(chat_client, user_input)
+                except (KeyboardInterrupt, EOFError):
+                    # Ctrl+C, or end of input when stdin is piped
+                    print('\nGoodbye!\n')
+
+        except APIClientError:
+            # Re-raise our own exceptions without wrapping them twice
+            raise
         except Exception as e:
             raise APIClientError(f"Failed to start chat loop: {e}") from e
+
+    @staticmethod
+    def _print_streamed_response(chat_client: ChatClient, message: str) -> None:
+        """Print the AI response to message as it is generated.
+
+        Args:
+            chat_client: Client to send the message with
+            message: User input to send
+        """
+        print('AI: ', end='', flush=True)
+        received = False
+        try:
+            for chunk in chat_client.iter_message(message):
+                print(chunk, end='', flush=True)
+                received = True
+        except APIClientError as e:
+            logger.warning('API error streaming message: %s', e)
+            received = False
+
+        print('\n' if received else '\nError getting response\n')
@@ -63,9 +63,9 @@ def _get_api_key_from_config_name(provider: ProviderName, config_name: str) -> s
     '''
 
     secret_file_conf: SecretsConfig = load_secrets_config()
-    if config_name in secret_file_conf:
+    try:
         return secret_file_conf[config_name]
-    else:
+    except KeyError:
         raise ValueError(
             f'No API key found for {provider} with config name {config_name}'
-        )
+        ) from None
@@ -11,6 +11,9 @@ Classes:
     OpenAICompatibleClient: Implementation for OpenAI-compatible APIs
     RestAPICompatibleClient: Implementation for generic REST APIs
 
+Functions:
+    close_connection_pools: Close the HTTP connection pools shared by all clients
+
 Exceptions:
     APIClientError: Base exception for API client errors
     UnsupportedAPITypeError: Raised when an unsupported API type is requested
@@ -27,7 +30,7 @@ from .types import (
     ChatMessage,
     ChatCompletionResponse,
 )
-from typing import Callable, Self
+from typing import Callable, Iterator, Self, Sequence, cast
 from abc import ABC, abstractmethod
 from typing_extensions import override
 
@@ -56,6 +59,25 @@ class ResponseConversionError(APIClientError):
     pass
 
 
+def _validate_client_params(base_url: str, api_key: str, model_name: str) -> None:
+    """Check that the connection parameters shared by all clients are set.
+
+    Args:
+        base_url: The base URL for the API endpoint
+        api_key: Authentication key for the API
+        model_name: Name of the model to use for requests
+
+    Raises:
+        InvalidParameterError: If any parameter is empty or None
+    """
+    if not base_url or not base_url.strip():
+        raise InvalidParameterError("base_url must be provided and non-empty")
+    if not api_key or not api_key.strip():
+        raise InvalidParameterError("api_key must be provided and non-empty")
+    if not model_name or not model_name.strip():
+        raise InvalidParameterError("model_name must be provided and non-empty")
+
+
 class BaseAPIClient(ABC):
     """Abstract base class for all API client implementations.
 
@@ -88,19 +110,16 @@ class BaseAPIClient(ABC):
             InvalidParameterError: If any parameter is empty or None
         """
         # All implementations should validate parameters
-        if not base_url or not base_url.strip():
-            raise InvalidParameterError("base_url must be provided and non-empty")
-        if not api_key or not api_key.strip():
-            raise InvalidParameterError("api_key must be provided and non-empty")
-        if not model_name or not model_name.strip():
-            raise InvalidParameterError("model_name must be provided and non-empty")
+        _validate_client_params(base_url, api_key, model_name)
 
     @abstractmethod
-    def chat_completion(self, messages: list[ChatMessage]) -> ChatCompletionResponse:
+    def chat_completion(
+        self, messages: Sequence[ChatMessage]
+    ) -> ChatCompletionResponse:
         """Send chat completion request and return response.
 
         Args:
-            messages: List of chat messages to send to the API
+            messages: Sequence of chat messages to send to the API
 
         Returns:
             ChatCompletionResponse: The API response containing generated content
@@ -110,6 +129,27 @@ class BaseAPIClient(ABC):
         """
         pass
 
+    def chat_completion_stream(
+        self, messages: Sequence[ChatMessage]
+    ) -> Iterator[str]:
+        """Send chat completion request and yield the content as it arrives.
+
+        The default implementation waits for the full response and yields it
+        as a single chunk; clients whose API supports streaming override it.
+
+        Args:
+            messages: Sequence of chat messages to send to the API
+
+        Yields:
+            str: Successive pieces of the generated content
+
+        Raises:
+            Exception: If the API request fails or returns an error
+        """
+        content = self.chat_completion(messages).get_content()
+        if content:
+            yield content
+
     @abstractmethod
     def get_model_name(self) -> str:
         """Get the model name being used by this client.
@@ -183,12 +223,12 @@ class CompatibleClientDispatcher:
         Raises:
             UnsupportedAPITypeError: If no handler is registered for the given API type
         """
-        if key in self.registry:
+        try:
             handler_class = self.registry[key]
-            # Instantiate the class with the provided parameters
-            return handler_class(base_url, api_key, model_name)
-        else:
-            raise UnsupportedAPITypeError(f"No handler for: {key}")
+        except KeyError:
+            raise UnsupportedAPITypeError(f"No handler for: {key}") from None
+        # Instantiate the class with the provided parameters
+        return handler_class(base_url, api_key, model_name)
 
 
 class CompatibleClient:
@@ -248,13 +288,8 @@ class CompatibleClient:
         Raises:
             InvalidParameterError: If any parameter is empty or None
         """
-        # Validate parameters early
-        if not base_url or not base_url.strip():
-            raise InvalidParameterError("base_url must be provided and non-empty")
-        if not api_key or not api_key.strip():
-            raise InvalidParameterError("api_key must be provided and non-empty")
-        if not model_name or not model_name.strip():
-            raise InvalidParameterError("model_name must be provided and non-empty")
+        # Validate parameters early; the API client itself is built lazily
+        _validate_client_params(base_url, api_key, model_name)
 
         # Use the provided dispatcher, or fall back to the default
         self.dispatcher = dispatcher or CompatibleClientDispatcher()
@@ -276,27 +311,26 @@ class CompatibleClient:
             UnsupportedAPITypeError: If no handler is registered for the API type
         """
         if self._client is None:
-            try:
-                self._client = self.dispatcher(
-                    self.api_type, self.base_url, self.api_key, self.model_name
-                )
-                # Apply timeout configuration if stored and applicable
-                if self._rest_timeout_config is not None and hasattr(
-                    self._client, 'set_timeout'
-                ):
-                    connect_timeout, read_timeout = self._rest_timeout_config
-                    self._client.set_timeout(connect_timeout, read_timeout)
-            except KeyError as e:
-                raise UnsupportedAPITypeError(
-                    f"Unsupported API type: {self.api_type}"
-                ) from e
+            # The dispatcher raises UnsupportedAPITypeError for unknown types;
+            # errors from the client constructor propagate unchanged
+            self._client = self.dispatcher(
+                self.api_type, self.base_url, self.api_key, self.model_name
+            )
+            # Apply timeout configuration if stored and applicable
+            if self._rest_timeout_config is not None and hasattr(
+                self._client, 'set_timeout'
+            ):
+                connect_timeout, read_timeout = self._rest_timeout_config
+                self._client.set_timeout(connect_timeout, read_timeout)
         return self._client
 
-    def chat_completion(self, messages: list[ChatMessage]) -> ChatCompletionResponse:
+    def chat_completion(
+        self, messages: Sequence[ChatMessage]
+    ) -> ChatCompletionResponse:
         """Send chat completion request using the underlying client.
 
         Args:
-            messages: List of chat messages to send to the API
+            messages: Sequence of chat messages to send to the API
 
         Returns:
             ChatCompletionResponse: The API response containing generated content
@@ -308,6 +342,24 @@ class CompatibleClient:
         """
         return self.client.chat_completion(messages)
 
+    def chat_completion_stream(
+        self, messages: Sequence[ChatMessage]
+    ) -> Iterator[str]:
+        """Stream a chat completion using the underlying client.
+
+        Args:
+            messages: Sequence of chat messages to send to the API
+
+        Returns:
+            Iterator[str]: Successive pieces of the generated content
+
+        Raises:
+            UnsupportedAPITypeError: If the API type is not supported
+            APIClientError: If the API request fails or returns an error
+            ResponseConversionError: If a streamed chunk cannot be parsed
+        """
+        return self.client.chat_completion_stream(messages)
+
     def get_model_name(self) -> str:
         """Get the model name being used.
 
@@ -342,8 +394,7 @@ class CompatibleClient:
         It's safe to call multiple times.
         """
         if self._client is not None:
-            if hasattr(self._client, 'close'):
-                self._client.close()
+            self._client.close()  # BaseAPIClient always provides close()
 
     def configure_rest_timeouts(
         self, connect_timeout: float, read_timeout: float
@@ -384,6 +435,78 @@ from .types import (
     MessageRole,
 )
 
+"""
+--------------------------------------------------------------------------
+Shared HTTP connection pools
+--------------------------------------------------------------------------
+"""
+import atexit
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+
+# One pool per (scheme, host) so that every client talking to the same
+# provider reuses open TCP/TLS connections instead of handshaking again.
+# Authentication is sent per request, so clients with different API keys
+# can safely share a pool. For requests only the transport adapter is
+# shared: each client keeps its own Session, and with it its own cookies.
+_POOL_LOCK = threading.Lock()
+_HTTPX_POOLS: dict[tuple[str, str], httpx.Client] = {}
+_REQUESTS_POOLS: dict[tuple[str, str], HTTPAdapter] = {}
+
+
+def _pool_key(base_url: str) -> tuple[str, str]:
+    """Return the (scheme, host) key identifying a connection pool."""
+    parts = urlsplit(base_url)
+    return (parts.scheme.lower(), parts.netloc.lower())
+
+
+def _shared_httpx_client(base_url: str) -> httpx.Client:
+    """Get the shared httpx client for the host of base_url, creating it if needed."""
+    key = _pool_key(base_url)
+    with _POOL_LOCK:
+        client = _HTTPX_POOLS.get(key)
+        if client is None or client.is_closed:
+            client = httpx.Client(follow_redirects=True)
+            _HTTPX_POOLS[key] = client
+        return client
+
+
+def _new_requests_session(base_url: str) -> requests.Session:
+    """Create a requests session that uses the shared pool for the host of base_url."""
+    key = _pool_key(base_url)
+    with _POOL_LOCK:
+        adapter = _REQUESTS_POOLS.get(key)
+        if adapter is None:
+            adapter = HTTPAdapter()
+            _REQUESTS_POOLS[key] = adapter
+
+    session = requests.Session()
+    session.mount(f'{key[0]}://', adapter)
+    return session
+
+
+def close_connection_pools() -> None:
+    """Close every shared HTTP connection pool.
+
+    Existing clients keep working afterwards: each one picks up a fresh pool
+    on its next request. Called automatically at interpreter exit.
+    """
+    with _POOL_LOCK:
+        for client in _HTTPX_POOLS.values():
+            client.close()
+        for adapter in _REQUESTS_POOLS.values():
+            adapter.close()
+        _HTTPX_POOLS.clear()
+        _REQUESTS_POOLS.clear()
+
+
+atexit.register(close_connection_pools)
+
+
 """
 --------------------------------------------------------------------------
 OpenAI API compatible client
@@ -392,12 +515,10 @@ OpenAI API compatible client
 from openai import OpenAI
 
 from openai.types.chat.chat_completion import ChatCompletion
-from openai.types.chat import (
-    ChatCompletionUserMessageParam,
-    ChatCompletionAssistantMessageParam,
-    ChatCompletionMessageParam,
-    ChatCompletionSystemMessageParam,
-)
+from openai.types.chat import ChatCompletionMessageParam
+
+# Roles forwarded to the OpenAI API; others are skipped
+_OPENAI_MESSAGE_ROLES = frozenset({'user', 'assistant', 'system'})
 
 
 @CompatibleClientDispatcher.register(api_key='openai')
@@ -417,6 +538,10 @@ class OpenAICompatibleClient(BaseAPIClient):
     Key attributes:
         client: OpenAI client instance for API communication
         model_name: Name of the model to use for requests
+
+    Note:
+        The underlying HTTP connections are shared with all other clients
+        talking to the same host (see close_connection_pools()).
     """
 
     def __init__(self, base_url: str, api_key: str, model_name: str) -> None:
@@ -434,11 +559,35 @@ class OpenAICompatibleClient(BaseAPIClient):
         super().__init__(base_url, api_key, model_name)
 
         # initialize client attributes
-        self.client: OpenAI = OpenAI(base_url=base_url, api_key=api_key)
+        self.base_url: str = base_url
+        self.api_key: str = api_key
         self.model_name: str = model_name
         self.openai_messages: list[ChatCompletionMessageParam] = []
+        self._client: OpenAI | None = None
+        self._http_client: httpx.Client | None = None
+
+    @property
+    def client(self) -> OpenAI:
+        """Get the OpenAI client, rebuilding it if its connection pool was closed.
 
-    def _convert_messages(self, messages: list[ChatMessage]) -> None:
+        The underlying httpx client is shared with every client talking to
+        the same host, so after close_connection_pools() the next request
+        transparently picks up a fresh pool.
+
+        Returns:
+            OpenAI: Client bound to the shared pool for the configured host
+        """
+        http_client = self._http_client
+        if self._client is None or http_client is None or http_client.is_closed:
+            self._http_client = _shared_httpx_client(self.base_url)
+            self._client = OpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                http_client=self._http_client,
+            )
+        return self._client
+
+    def _convert_messages(self, messages: Sequence[ChatMessage]) -> None:
         """Convert ChatMessage objects to OpenAI format.
 
         This method transforms the generic ChatMessage objects into OpenAI's
@@ -448,26 +597,16 @@ class OpenAICompatibleClient(BaseAPIClient):
         Args:
             messages: List of ChatMessage objects to convert
         """
-        self.openai_messages = []  # Clear previous message
-        for message in messages:
-            if message.role == 'user':
-                self.openai_messages.append(
-                    ChatCompletionUserMessageParam(
-                        role='user', content=message.content or ''
-                    )
-                )
-            elif message.role == 'assistant':
-                self.openai_messages.append(
-                    ChatCompletionAssistantMessageParam(
-                        role='assistant', content=message.content or ''
-                    )
-                )
-            elif message.role == 'system':
-                self.openai_messages.append(
-                    ChatCompletionSystemMessageParam(
-                        role='system', content=message.content or ''
-                    )
-                )
+        # The OpenAI message params are TypedDicts, so plain dicts with the
+        # same keys are what their constructors would build anyway
+        self.openai_messages = [
+            cast(
+                ChatCompletionMessageParam,
+                {'role': message.role, 'content': message.content or ''},
+            )
+            for message in messages
+            if message.role in _OPENAI_MESSAGE_ROLES
+        ]
 
     def _convert_response(
         self, openai_response: ChatCompletion
@@ -519,11 +658,13 @@ class OpenAICompatibleClient(BaseAPIClient):
         )
 
     @override
-    def chat_completion(self, messages: list[ChatMessage]) -> ChatCompletionResponse:
+    def chat_completion(
+        self, messages: Sequence[ChatMessage]
+    ) -> ChatCompletionResponse:
         """Send chat completion request to OpenAI API.
 
         Args:
-            messages: List of chat messages to send to the API
+            messages: Sequence of chat messages to send to the API
 
         Returns:
             ChatCompletionResponse: The API response containing generated content
@@ -538,6 +679,31 @@ class OpenAICompatibleClient(BaseAPIClient):
         )
         return self._convert_response(openai_response)
 
+    @override
+    def chat_completion_stream(
+        self, messages: Sequence[ChatMessage]
+    ) -> Iterator[str]:
+        """Stream a chat completion from the OpenAI API.
+
+        Args:
+            messages: Sequence of chat messages to send to the API
+
+        Yields:
+            str: Content deltas in the order the API sends them
+
+        Raises:
+            Exception: If the OpenAI API request fails
+        """
+        self._convert_messages(messages)
+
+        stream = self.client.chat.completions.create(
+            model=self.model_name, messages=self.openai_messages, stream=True
+        )
+        with stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
     @override
     def get_model_name(self) -> str:
         """Get the model name being used.
@@ -549,12 +715,12 @@ class OpenAICompatibleClient(BaseAPIClient):
 
     @override
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        if hasattr(self.client, 'close'):
-            self.client.close()
-        elif hasattr(self.client, '_client') and hasattr(self.client._client, 'close'):
-            # OpenAI client use httpx internal client
-            self.client._client.close()
+        """Release the client.
+
+        The HTTP connection pool is shared with other clients for the same
+        host and stays open; use close_connection_pools() to close it.
+        """
+        pass
 
 
 """
@@ -564,9 +730,15 @@ REST API compatible client.
 """
 
 import json
-import requests  # type: ignore
+from pydantic import ValidationError
 from requests.models import Response  # type: ignore # noqa: E501
-from typing import Any
+
+try:
+    # Optional faster JSON codec, installed with the 'fast' extra
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
 
 
 @CompatibleClientDispatcher.register(api_key='requests')
@@ -626,33 +798,33 @@ class RestAPICompatibleClient(BaseAPIClient):
         self.connect_timeout: float = 30.0  # Default connection timeout
         self.read_timeout: float = 60.0  # Default read timeout
         self.rest_messages: list[dict[str, str | None]] = []
-        # Optional, maintain a session for connection pooling
+        # Per-request headers; the connection pool is shared between clients
+        self._headers: dict[str, str] = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
         self._session: requests.Session | None = None
 
     @property
     def session(self) -> requests.Session:
-        """Get or create a requests session for connection pooling.
+        """Get the requests session used by this client.
+
+        The session, and its cookie jar, belong to this client alone, while
+        its connection pool is shared with every client talking to the same
+        host.
 
         Returns:
-            requests.Session: Configured session with headers and timeout
+            requests.Session: Session bound to the shared pool for the host
         """
         if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update(
-                {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                }
-            )
-            # Set configurable timeout (connect, read)
-            self._session.timeout = (self.connect_timeout, self.read_timeout)
+            self._session = _new_requests_session(self.base_url)
         return self._session
 
     def set_timeout(self, connect_timeout: float, read_timeout: float) -> None:
-        """Set new timeout values and reset the session if it exists.
+        """Set new timeout values.
 
         This method allows changing timeout values after client initialization.
-        If a session already exists, it will be closed and recreated with new timeout values.
+        The new values apply to the next request.
 
         Args:
             connect_timeout: New connection timeout in seconds
@@ -669,11 +841,6 @@ class RestAPICompatibleClient(BaseAPIClient):
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
 
-        # Reset session to apply new timeout values
-        if self._session:
-            self._session.close()
-            self._session = None
-
     def get_timeout(self) -> tuple[float, float]:
         """Get current timeout values.
 
@@ -716,12 +883,7 @@ class RestAPICompatibleClient(BaseAPIClient):
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
 
-        # Reset session to apply new timeout values
-        if self._session:
-            self._session.close()
-            self._session = None
-
-    def _convert_messages(self, messages: list[ChatMessage]) -> None:
+    def _convert_messages(self, messages: Sequence[ChatMessage]) -> None:
         """Convert ChatMessage objects to dictionary format for REST API.
 
         This method transforms the generic ChatMessage objects into simple
@@ -739,13 +901,13 @@ class RestAPICompatibleClient(BaseAPIClient):
             for message in messages
         ]
 
-    def _from_dict(self, data: dict[str, Any]) -> ChatCompletionResponse:
-        """
-        Create from dictionary (e.g., from REST API JSON response).
+    def _from_json(self, raw: bytes) -> ChatCompletionResponse:
+        """Create from a raw JSON body in a single pass.
 
-        This replaces the deprecated ChatCompletion.parse_obj method.
+        pydantic-core parses the bytes straight into the model, skipping
+        the intermediate dict built by json.loads().
         """
-        return ChatCompletionResponse.model_validate(data)
+        return ChatCompletionResponse.model_validate_json(raw)
 
     def _convert_response(self, rest_response: Response) -> ChatCompletionResponse:
         """Convert REST API response to ChatCompletionResponse format.
@@ -762,20 +924,23 @@ class RestAPICompatibleClient(BaseAPIClient):
         # Check for successful response
         if rest_response.status_code == 200:
             try:
-                # Parse JSON response
-                response_data = rest_response.json()
-                # Use our new method instead of deprecated parse_obj
-                chat_response: ChatCompletionResponse = self._from_dict(
-                    data=response_data
+                # Parse and validate the JSON body in one step
+                chat_response: ChatCompletionResponse = self._from_json(
+                    rest_response.content
                 )
                 return chat_response
-            except ValueError as e:
-                # JSON parsing failed
+            except ValidationError as e:
+                if any(error['type'] == 'json_invalid' for error in e.errors()):
+                    # JSON parsing failed
+                    raise ResponseConversionError(
+                        f'Failed to parse JSON response: {e}. Response text: {rest_response.text[:500]}'
+                    ) from e
+                # ChatCompletionResponse parsing failed
                 raise ResponseConversionError(
-                    f'Failed to parse JSON response: {e}. Response text: {rest_response.text[:500]}'
+                    f'Failed to convert response to ChatCompletionResponse: {e}'
                 ) from e
             except Exception as e:
-                # ChatCompletionResponse parsing failed
+                # Anything else raised while reading or validating the body
                 raise ResponseConversionError(
                     f'Failed to convert response to ChatCompletionResponse: {e}'
                 ) from e
@@ -795,11 +960,13 @@ class RestAPICompatibleClient(BaseAPIClient):
             )
 
     @override
-    def chat_completion(self, messages: list[ChatMessage]) -> ChatCompletionResponse:
+    def chat_completion(
+        self, messages: Sequence[ChatMessage]
+    ) -> ChatCompletionResponse:
         """Send chat completion request to REST API endpoint.
 
         Args:
-            messages: List of chat messages to send to the API
+            messages: Sequence of chat messages to send to the API
 
         Returns:
             ChatCompletionResponse: The API response containing generated content
@@ -816,12 +983,94 @@ class RestAPICompatibleClient(BaseAPIClient):
         }
         rest_response: Response = self.session.post(
             url=self.base_url,
-            data=json.dumps(data),
+            data=_json_dumps(data),
+            headers=self._headers,
+            timeout=(self.connect_timeout, self.read_timeout),
         )
 
         assert rest_response is not None
         return self._convert_response(rest_response)
 
+    @override
+    def chat_completion_stream(
+        self, messages: Sequence[ChatMessage]
+    ) -> Iterator[str]:
+        """Stream a chat completion from a REST endpoint using server-sent events.
+
+        Sends the request with 'stream': true and parses the 'data:' lines of
+        the event stream until the '[DONE]' marker. Endpoints that ignore the
+        stream flag and answer with a regular JSON completion yield its
+        content as a single chunk.
+
+        Args:
+            messages: Sequence of chat messages to send to the API
+
+        Yields:
+            str: Content deltas in the order the API sends them
+
+        Raises:
+            APIClientError: If the HTTP request fails, returns an error status or
+                           reports an error event in the stream
+            ResponseConversionError: If a streamed chunk is not valid JSON
+        """
+        self._convert_messages(messages)
+
+        data = {
+            'messages': self.rest_messages,
+            'model': self.model_name,
+            'stream': True,
+        }
+        rest_response: Response = self.session.post(
+            url=self.base_url,
+            data=_json_dumps(data),
+            headers=self._headers,
+            timeout=(self.connect_timeout, self.read_timeout),
+            stream=True,
+        )
+
+        with rest_response:
+            if rest_response.status_code != 200:
+                # Raises APIClientError with the provider's error details
+                self._convert_response(rest_response)
+
+            content_type = rest_response.headers.get('Content-Type', '')
+            if not content_type.lower().startswith('text/event-stream'):
+                # The endpoint ignored 'stream': true and sent a whole completion
+                content = self._convert_response(rest_response).get_content()
+                if content:
+                    yield content
+                return
+
+            # Decode explicitly: SSE is always UTF-8, but requests falls back to
+            # ISO-8859-1 for text/* responses without a charset
+            for raw_line in rest_response.iter_lines():
+                line = raw_line.decode('utf-8')
+                if not line or not line.startswith('data:'):
+                    continue  # Blank separators, comments and keep-alives
+                payload = line[len('data:') :].strip()
+                if payload == '[DONE]':
+                    break
+                try:
+                    chunk = _json_loads(payload)
+                except ValueError as e:
+                    raise ResponseConversionError(
+                        f'Failed to parse streamed chunk: {e}. Chunk: {payload[:500]}'
+                    ) from e
+
+                error = chunk.get('error')
+                if error:
+                    message = (
+                        error.get('message', str(error))
+                        if isinstance(error, dict)
+                        else str(error)
+                    )
+                    raise APIClientError(f'API stream reported an error: {message}')
+
+                choices = chunk.get('choices') or [{}]
+                content = (choices[0].get('delta') or {}).get('content')
+                if content:
+                    yield content
+
     @override
     def get_model_name(self) -> str:
         """Get the model name being used.
@@ -833,10 +1082,13 @@ class RestAPICompatibleClient(BaseAPIClient):
 
     @override
     def close(self) -> None:
-        """Close the requests session."""
-        if self._session:
-            self._session.close()
-            self._session = None
+        """Release the client's requests session.
+
+        The session is not closed explicitly, because that would also close
+        the connection pool shared with other clients of the same host; use
+        close_connection_pools() to close it.
+        """
+        self._session = None
 
 
 # class HuggingFaceAPICompatibleClient(BaseAPIClient):
@@ -60,11 +60,12 @@ class ProvidersConfigHandler:
         """
         providers_file: ProvidersFile = load_providers_file()
 
-        if provider not in providers_file:
+        try:
+            return providers_file[provider]
+        except KeyError:
             raise ValueError(
-                f'Provider "{provider}" not found. Available: {ProvidersConfigHandler.available_providers()}'
-            )
-        return providers_file[provider]
+                f'Provider "{provider}" not found. Available: {list(providers_file)}'
+            ) from None
 
     @staticmethod
     def get_provider_config(
@@ -82,15 +83,11 @@ class ProvidersConfigHandler:
         Raises:
             ValueError: If provider not found or index out of range
         """
-        providers_file: ProvidersFile = load_providers_file()
-
-        if provider not in providers_file:
-            raise ValueError(
-                f'Provider "{provider}" not found. Available: {ProvidersConfigHandler.available_providers()}'
-            )
-
-        provider_configs_list: ProvidersConfigList = providers_file[provider]
-        if config_index >= len(provider_configs_list):
+        provider_configs_list: ProvidersConfigList = (
+            ProvidersConfigHandler.available_provider_configs(provider)
+        )
+        # Negative indexes would silently select configs from the end of the list
+        if not 0 <= config_index < len(provider_configs_list):
             raise ValueError(
                 f'Index {config_index} out of range for provider "{provider}" (max: {len(provider_configs_list) - 1})'
             )
@@ -115,13 +112,13 @@ class ProvidersConfigHandler:
             ProvidersConfigHandler.get_provider_config(provider, config_index)
         )
 
-        if attribute not in provider_config:
+        try:
+            return str(provider_config[attribute])
+        except KeyError:
             available: list[str] = list(provider_config.keys())
             raise ValueError(
                 f'Attribute "{attribute}" not found for provider "{provider}". Available: {available}'
-            )
-
-        return str(provider_config[attribute])
+            ) from None
 
     @staticmethod
     def get_provider_api_supported(
@@ -154,10 +151,10 @@ class ProvidersConfigHandler:
         )
 
         endpoints: ApiEndpoints = provider_config['api_endpoints']
-        if endpoint_type not in endpoints:
+        try:
+            return endpoints[endpoint_type]
+        except KeyError:
             available: list[str] = list(endpoints.keys())
             raise ValueError(
                 f'Endpoint type "{endpoint_type}" not found for provider "{provider}". Available: {available}'
-            )
-
-        return endpoints[endpoint_type]
+            ) from None
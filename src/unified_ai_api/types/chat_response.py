@@ -1,7 +1,7 @@
 """Custom chat response types that are provider-agnostic."""
 
 from typing import Literal, TypeAlias
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 MessageRole: TypeAlias = Literal['system', 'user', 'assistant']
@@ -11,6 +11,9 @@ MessageRole: TypeAlias = Literal['system', 'user', 'assistant']
 class ChatMessage(BaseModel):
     """A single chat message."""
 
+    # Immutable, so one instance can safely be shared between chat histories
+    model_config = ConfigDict(frozen=True)
+
     role: MessageRole = Field(..., description='The role of the message sender.')
     content: str | None = Field(None, description='The content of the message.')
     name: str | None = Field(None, description='The name of the sender of the message.')
@@ -81,13 +84,13 @@ class ChatCompletionResponse(BaseModel):
     def get_content(self) -> str | None:
         """Get the content of the first choice, if available."""
 
-        if self.choices and len(self.choices) > 0:
+        if self.choices:
             return self.choices[0].message.content
         return None
 
     def get_role(self) -> MessageRole | None:
         """Get the role of the first choice, if available."""
 
-        if self.choices and len(self.choices) > 0:
+        if self.choices:
             return self.choices[0].message.role
         return None
@@ -61,6 +61,7 @@ if version_info >= (3, 11):
 
 # Concrete instance derived from the configuration - single source of truth
 PROVIDER_NAMES: list[str] = list(get_args(ProviderName))
+_PROVIDER_NAMES_SET: frozenset[str] = frozenset(PROVIDER_NAMES)
 
 
 # Runtime validation function (required by project specification memory)
@@ -78,7 +79,7 @@ def is_valid_provider_name(provider_name: str) -> bool:
         This function provides runtime validation as required by the
         Provider Name Validation specification memory.
     """
-    return provider_name in PROVIDER_NAMES
+    return provider_name in _PROVIDER_NAMES_SET
 
 
 
@@ -1,12 +1,79 @@
 """
 pytest configuration for unified_ai_api tests.
 
-This file configures the Python path to allow imports from the src directory.
+This file configures the Python path to allow imports from the src directory
+and provides fixtures shared by the test modules.
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to Python path so we can import unified_ai_api
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture
+def manager():
+    """Fresh, unconfigured APIConnectionManager.
+
+    Construction is cheap and configure_api() mutates the manager, so every
+    test gets its own instance instead of sharing one across the session.
+    """
+    from unified_ai_api import APIConnectionManager
+
+    return APIConnectionManager()
+
+
+def _bundled_providers():
+    """Provider names from the bundled providers.json."""
+    from unified_ai_api import APIConnectionManager
+
+    return tuple(APIConnectionManager().get_available_providers())
+
+
+def pytest_generate_tests(metafunc):
+    """Run tests taking a `provider` argument once per bundled provider."""
+    if "provider" in metafunc.fixturenames:
+        metafunc.parametrize("provider", _bundled_providers())
+
+
+@pytest.fixture(scope="session")
+def providers():
+    """Provider names from the bundled providers.json, read once per session."""
+    return _bundled_providers()
+
+
+@pytest.fixture
+def fake_keys(monkeypatch):
+    """Serve a fixed API key instead of reading secret.json."""
+    monkeypatch.setattr(
+        "unified_ai_api.api_connection.get_secret_api_key",
+        lambda provider, config_name=None, config_index=0: "sk-test-key",
+    )
+
+
+@pytest.fixture
+def configured_manager(manager, fake_keys):
+    """Manager configured for the first OPENROUTER config over the openai API."""
+    return manager.configure_api("OPENROUTER", 0, "openai")
+
+
+@pytest.fixture
+def make_response():
+    """Factory building a ChatCompletionResponse with a single assistant reply."""
+    from unified_ai_api.types import ChatChoice, ChatCompletionResponse, ChatMessage
+
+    def _make_response(content):
+        return ChatCompletionResponse.create_response(
+            choices=[
+                ChatChoice(
+                    index=0,
+                    message=ChatMessage.create_message(role="assistant", content=content),
+                )
+            ]
+        )
+
+    return _make_response
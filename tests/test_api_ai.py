@@ -42,6 +42,18 @@ def test_package_interface_clean() -> None:
         assert len(unified_ai_api.__all__) == 3
 
 
+def test_cli_version_exits_cleanly(capsys) -> None:
+    '''Test that the CLI handles --version without starting a session.'''
+    from unified_ai_api import __version__
+    from unified_ai_api.__main__ import main
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(['--version'])
+
+    assert exc_info.value.code == 0
+    assert __version__ in capsys.readouterr().out
+
+
 class TestAPIConnectionManager:
     '''Test suite for APIConnectionManager functionality.'''
 
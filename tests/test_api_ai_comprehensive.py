@@ -8,18 +8,46 @@ Tests cover:
 - Configuration management
 '''
 
-import pytest
+import asyncio
+import gc
+import json
+import logging
 import os
+import threading
 from unittest.mock import patch, Mock
 
+import httpx
+import pytest
+
+from unified_ai_api import APIConnectionManager, BaseAPIClient, OpenAICompatibleClient
+from unified_ai_api._utils import (
+    config_loaders,
+    load_providers_file,
+    validate_provider_config_fields,
+)
+from unified_ai_api.api_connection import APIClientError, ChatClient, _ChatClientToken
+from unified_ai_api.auth_keys import get_secret_api_key
+from unified_ai_api.compatible_client_api import (
+    CompatibleClient,
+    InvalidParameterError,
+    ResponseConversionError,
+    RestAPICompatibleClient,
+    UnsupportedAPITypeError,
+    close_connection_pools,
+)
+from unified_ai_api.providers_config_handlers import ProvidersConfigHandler
+from unified_ai_api.types import (
+    ApiSupportedContent,
+    ChatMessage,
+    ProviderName,
+)
+
 
 class TestAPIConnectionManagerAdvanced:
     '''Advanced test suite for APIConnectionManager.'''
 
     def test_package_exports_all_expected_classes(self):
         '''Test that all expected classes are properly exported.'''
-        from unified_ai_api import APIConnectionManager, BaseAPIClient, OpenAICompatibleClient
-
         assert APIConnectionManager is not None
         assert BaseAPIClient is not None
         assert OpenAICompatibleClient is not None
@@ -29,14 +57,8 @@ class TestAPIConnectionManagerAdvanced:
         assert hasattr(BaseAPIClient, '__abstractmethods__')  # Should be abstract
         assert callable(OpenAICompatibleClient)
 
-    def test_api_connection_manager_full_workflow(self):
+    def test_api_connection_manager_full_workflow(self, manager, providers, fake_keys):
         '''Test complete workflow with APIConnectionManager.'''
-        from unified_ai_api import APIConnectionManager
-
-        manager = APIConnectionManager()
-
-        # Test provider discovery
-        providers = manager.get_available_providers()
         assert len(providers) > 0
 
         # Test getting configs for first provider
@@ -55,78 +77,95 @@ class TestAPIConnectionManagerAdvanced:
             result = manager.validate_configuration()
             assert isinstance(result, bool)
 
-    def test_connection_state_management(self):
+    def test_connection_state_management(self, manager, fake_keys):
         '''Test that connection state is properly managed.'''
-        from unified_ai_api import APIConnectionManager
-
-        manager = APIConnectionManager()
-
         # Initially not connected - returns empty strings
         params = manager.get_connection_params()
         assert isinstance(params, dict)
         assert params.get('provider') == ''
 
-        # After successful configuration (if possible)
-        try:
-            manager.configure_api('OPENROUTER', 0, 'openai')
-            success = manager.validate_configuration()
-            if success:
-                params = manager.get_connection_params()
-                assert params.get('provider') != ''
-                assert 'model_name' in params
-        except (ValueError, FileNotFoundError, KeyError):
-            # Expected when no API key is available
-            pass
-
-    def test_multiple_connections(self):
-        '''Test creating multiple connections in sequence.'''
-        from unified_ai_api import APIConnectionManager
-
-        manager = APIConnectionManager()
-
-        # Configure first connection
-        try:
-            manager.configure_api('OPENROUTER', 0, 'openai')
-            result1 = manager.validate_configuration()
-            assert isinstance(result1, bool)
-        except (ValueError, FileNotFoundError, KeyError):
-            result1 = False
-
-        # Configure second connection (should replace first)
-        try:
-            manager.configure_api('HUGGINGFACE', 0, 'openai')
-            result2 = manager.validate_configuration()
-            assert isinstance(result2, bool)
-
-            # If second succeeded, params should reflect HUGGINGFACE
-            if result2:
-                params = manager.get_connection_params()
-                assert params != {}
-        except (ValueError, FileNotFoundError, KeyError):
-            result2 = False
-
-    def test_interactive_setup_functionality(self):
-        '''Test that interactive_setup method exists and is callable.'''
-        from unified_ai_api import APIConnectionManager
-
-        manager = APIConnectionManager()
-
-        # Method should exist
-        assert hasattr(manager, 'interactive_setup')
-        assert callable(manager.interactive_setup)
-
-    def test_start_chat_loop_functionality(self):
-        '''Test that start_chat_loop method exists and raises error when not connected.'''
-        from unified_ai_api import APIConnectionManager
-        from unified_ai_api.compatible_client_api import InvalidParameterError
+        manager.configure_api('OPENROUTER', 0, 'openai')
+        assert manager.validate_configuration()
 
-        manager = APIConnectionManager()
-
-        # Method should exist
-        assert hasattr(manager, 'start_chat_loop')
-        assert callable(manager.start_chat_loop)
+        params = manager.get_connection_params()
+        assert params.get('provider') == 'OPENROUTER'
+        assert params['model_name'] != ''
 
-        # Should raise InvalidParameterError when no connection configured
+    def test_multiple_connections(self, manager, fake_keys):
+        '''Test creating multiple connections in sequence.'''
+        manager.configure_api('OPENROUTER', 0, 'openai')
+        assert manager.validate_configuration()
+
+        # Configuring a second connection replaces the first
+        manager.configure_api('HUGGINGFACE', 0, 'openai')
+        assert manager.validate_configuration()
+        assert manager.get_connection_params()['provider'] == 'HUGGINGFACE'
+
+    def test_reset_clears_configuration(self, manager):
+        '''Test that reset() returns the manager to an unconfigured state.'''
+        manager._connection_params['provider'] = 'OPENROUTER'
+        manager._secret_api_key = 'test-key'
+
+        assert manager.reset() is manager
+        assert manager.get_connection_params()['provider'] == ''
+        assert not hasattr(manager, '_secret_api_key')
+        assert not manager.validate_configuration()
+
+    def test_active_clients_are_not_kept_alive(self, configured_manager):
+        '''Test that abandoned clients are untracked and session IDs stay unique.'''
+        first = configured_manager.create_chatclient()
+        second = configured_manager.create_chatclient()
+        assert len(configured_manager._active_clients) == 2
+
+        del first
+        gc.collect()
+        assert len(configured_manager._active_clients) == 1
+
+        third = configured_manager.create_chatclient()
+        assert third._session_id != second._session_id
+
+        configured_manager.close_all_clients()
+        assert len(configured_manager._active_clients) == 0
+
+    def test_start_chat_loop_ends_on_eof(self, capsys, configured_manager):
+        '''Test that the chat loop exits cleanly when piped input runs out.'''
+        with patch('builtins.input', side_effect=EOFError):
+            configured_manager.start_chat_loop()
+
+        assert 'Goodbye!' in capsys.readouterr().out
+
+    def test_start_chat_loop_streams_responses(self, capsys, configured_manager):
+        '''Test that the chat loop prints streamed chunks as one AI reply.'''
+        with (
+            patch('builtins.input', side_effect=['Hi', EOFError]),
+            patch.object(ChatClient, 'iter_message', return_value=iter(['Hel', 'lo'])),
+        ):
+            configured_manager.start_chat_loop()
+
+        assert 'AI: Hello\n' in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        'attr',
+        [
+            'interactive_setup',
+            'start_chat_loop',
+            'get_available_providers',
+            'get_provider_configs',
+            'get_supported_api',
+            'configure_api',
+            'validate_configuration',
+            'get_connection_params',
+            'create_chatclient',
+            'close_all_clients',
+            'reset',
+        ],
+    )
+    def test_manager_exposes(self, manager, attr):
+        '''Test that the public manager methods exist and are callable.'''
+        assert callable(getattr(manager, attr))
+
+    def test_start_chat_loop_requires_configuration(self, manager):
+        '''Test that start_chat_loop raises when no connection is configured.'''
         with pytest.raises(InvalidParameterError):
             manager.start_chat_loop()
 
@@ -134,41 +173,75 @@ class TestAPIConnectionManagerAdvanced:
 class TestConfigurationSystem:
     '''Test suite for configuration system functionality.'''
 
-    def test_providers_config_handler_integration(self):
-        '''Test ProvidersConfigHandler class methods.'''
-        from unified_ai_api.providers_config_handlers import ProvidersConfigHandler
+    def test_providers_config_handler_integration(self, tmp_path, monkeypatch):
+        '''Test that ProvidersConfigHandler discovers the providers in the file.'''
+        config_file = tmp_path / 'providers.json'
+        config_file.write_text('{"OPENROUTER": [], "HUGGINGFACE": []}', encoding='utf-8')
+        monkeypatch.setattr(config_loaders, 'PROVIDER_FILE_PATH', config_file)
 
-        # Test available_providers
         providers = ProvidersConfigHandler.available_providers()
         assert isinstance(providers, list)
-        assert len(providers) > 0
+        assert providers == ['OPENROUTER', 'HUGGINGFACE']
 
-        # Test available_provider_configs
-        configs = ProvidersConfigHandler.available_provider_configs(providers[0])
+    def test_providers_config_handler_configs(self, provider):
+        '''Test that every provider has configs and supported APIs.'''
+        configs = ProvidersConfigHandler.available_provider_configs(provider)
         assert isinstance(configs, list)
         assert len(configs) > 0
 
-        # Test get_provider_api_supported
-        apis = ProvidersConfigHandler.get_provider_api_supported(providers[0], 0)
-        assert isinstance(apis, list)
-        assert len(apis) > 0
-
-    def test_auth_keys_integration(self):
-        '''Test auth_keys module integration.'''
-        from unified_ai_api.auth_keys import get_secret_api_key
-
-        # Should be callable without crashing
-        try:
-            key = get_secret_api_key('OPENROUTER')
-            assert isinstance(key, str)
-        except (ValueError, FileNotFoundError, KeyError):
-            # Expected when no config is available
-            pass
+        for config_index in range(len(configs)):
+            apis = ProvidersConfigHandler.get_provider_api_supported(
+                provider, config_index
+            )
+            assert isinstance(apis, list)
+            assert len(apis) > 0
+
+    def test_auth_keys_integration(self, tmp_path, monkeypatch):
+        '''Test that API keys are resolved from secret.json by config index and name.'''
+        config_name = load_providers_file()['OPENROUTER'][0]['config_name']
+        secret_file = tmp_path / 'secret.json'
+        secret_file.write_text(json.dumps({config_name: 'sk-or-test'}), encoding='utf-8')
+        monkeypatch.setattr(config_loaders, 'SECRET_FILE_PATH', secret_file)
+
+        assert get_secret_api_key('OPENROUTER') == 'sk-or-test'
+        assert get_secret_api_key('OPENROUTER', config_name=config_name) == 'sk-or-test'
+        with pytest.raises(ValueError, match='No API key found'):
+            get_secret_api_key('OPENROUTER', config_name='missing')
+
+        config_loaders.clear_config_cache()
+
+    def test_config_cache_reloads_on_file_change(self, tmp_path, monkeypatch):
+        '''Test that cached configuration is reused until the file changes.'''
+        config_file = tmp_path / 'providers.json'
+        config_file.write_text('{"OPENROUTER": []}', encoding='utf-8')
+        monkeypatch.setattr(config_loaders, 'PROVIDER_FILE_PATH', config_file)
+
+        first = config_loaders.load_providers_file()
+        assert config_loaders.load_providers_file() is first
+
+        config_file.write_text('{"OPENROUTER": [], "OPENAI": []}', encoding='utf-8')
+        os.utime(config_file, ns=(0, 0))
+        assert list(config_loaders.load_providers_file()) == ['OPENROUTER', 'OPENAI']
+
+        config_loaders.clear_config_cache()
+
+    def test_validate_provider_config_fields(self):
+        '''Test validation of required and non-empty provider config fields.'''
+        config = dict(load_providers_file()['OPENROUTER'][0])
+        assert validate_provider_config_fields(config)
+
+        assert not validate_provider_config_fields({**config, 'model_name': '  '})
+        assert not validate_provider_config_fields({**config, 'api_supported': []})
+        del config['api_endpoints']
+        assert not validate_provider_config_fields(config)
+
+    def test_get_provider_config_rejects_negative_index(self):
+        '''Test that negative config indexes are reported as out of range.'''
+        with pytest.raises(ValueError, match='out of range'):
+            ProvidersConfigHandler.get_provider_config('OPENROUTER', -1)
 
     def test_types_system(self):
         '''Test that type system is properly structured.'''
-        from unified_ai_api.types import ApiSupportedContent, ProviderName
-
         # Types should be importable
         assert ApiSupportedContent is not None
         assert ProviderName is not None
@@ -177,13 +250,8 @@ class TestConfigurationSystem:
 class TestErrorHandlingAdvanced:
     '''Advanced error handling tests.'''
 
-    def test_robust_error_handling(self):
+    def test_robust_error_handling(self, manager):
         '''Test robust error handling across various scenarios.'''
-        from unified_ai_api import APIConnectionManager
-        from unified_ai_api.compatible_client_api import InvalidParameterError
-
-        manager = APIConnectionManager()
-
         # Test with out-of-range config index - should raise InvalidParameterError
         with pytest.raises(InvalidParameterError):
             manager.configure_api('OPENROUTER', 999, 'openai')
@@ -192,12 +260,8 @@ class TestErrorHandlingAdvanced:
         params = manager.get_connection_params()
         assert isinstance(params, dict)
 
-    def test_concurrent_operations(self):
+    def test_concurrent_operations(self, manager):
         '''Test that manager handles rapid sequential operations.'''
-        from unified_ai_api import APIConnectionManager
-
-        manager = APIConnectionManager()
-
         # Rapid sequential calls should not break
         for i in range(5):
             providers = manager.get_available_providers()
@@ -212,7 +276,12 @@ class TestClientImplementations:
 
     def test_base_api_client_is_abstract(self):
         '''Test that BaseAPIClient cannot be instantiated directly.'''
-        from unified_ai_api import BaseAPIClient
+        # Subclasses must provide exactly these; streaming and close() have defaults
+        assert BaseAPIClient.__abstractmethods__ == {
+            '__init__',
+            'chat_completion',
+            'get_model_name',
+        }
 
         # Should be abstract and not instantiable
         with pytest.raises(TypeError):
@@ -220,8 +289,6 @@ class TestClientImplementations:
 
     def test_openai_compatible_client_instantiation(self):
         '''Test that OpenAICompatibleClient can be instantiated with proper parameters.'''
-        from unified_ai_api import OpenAICompatibleClient
-
         # Should be instantiable with proper parameters
         client = OpenAICompatibleClient(
             base_url="https://api.test.com", api_key="test-key", model_name="test-model"
@@ -233,39 +300,371 @@ class TestClientImplementations:
         assert client.get_model_name() == "test-model"
 
 
-# Integration tests
-def test_end_to_end_workflow():
-    '''Test complete end-to-end workflow.'''
-    from unified_ai_api import APIConnectionManager
+    def test_openai_client_converts_messages(self):
+        '''Test that chat messages become OpenAI role/content params in order.'''
+        client = OpenAICompatibleClient('https://api.test.com', 'key', 'm')
+        client._convert_messages(
+            [
+                ChatMessage.create_message(role='system', content='Be brief.'),
+                ChatMessage.create_message(role='user', content='Hi'),
+                ChatMessage.create_message(role='assistant', content=None),
+            ]
+        )
 
-    manager = APIConnectionManager()
+        assert client.openai_messages == [
+            {'role': 'system', 'content': 'Be brief.'},
+            {'role': 'user', 'content': 'Hi'},
+            {'role': 'assistant', 'content': ''},
+        ]
+
+    def test_compatible_client_reports_unknown_api_type(self):
+        '''Test that only an unregistered API type is reported as unsupported.'''
+        unknown = CompatibleClient('nope', 'https://api.test.com', 'm', 'key')
+        with pytest.raises(UnsupportedAPITypeError, match='nope'):
+            unknown.client
+
+        # A KeyError raised while building the client is not an API type problem
+        broken = CompatibleClient(
+            'openai',
+            'https://api.test.com',
+            'm',
+            'key',
+            dispatcher=Mock(side_effect=KeyError('missing setting')),
+        )
+        with pytest.raises(KeyError, match='missing setting'):
+            broken.client
+
+    def test_clients_share_connection_pool_per_host(self):
+        '''Test that clients for the same host reuse one connection pool.'''
+        rest_a = RestAPICompatibleClient('https://api.test.com/v1/chat', 'key-a', 'm')
+        rest_b = RestAPICompatibleClient('https://api.test.com/v2/chat', 'key-b', 'm')
+        # One pool, but separate sessions so cookies never cross credentials
+        assert rest_a.session is not rest_b.session
+        assert rest_a.session.cookies is not rest_b.session.cookies
+        assert rest_a.session.get_adapter(rest_a.base_url) is rest_b.session.get_adapter(
+            rest_b.base_url
+        )
+        assert rest_a._headers['Authorization'] != rest_b._headers['Authorization']
+
+        openai_a = OpenAICompatibleClient('https://api.test.com/v1', 'key-a', 'm')
+        openai_b = OpenAICompatibleClient('https://api.test.com/v1', 'key-b', 'm')
+        assert openai_a.client._client is openai_b.client._client
+
+        close_connection_pools()
+
+    def test_clients_survive_close_connection_pools(self, monkeypatch):
+        '''Test that a client created before close_connection_pools() still works.'''
+        completion = {
+            'id': '1',
+            'object': 'chat.completion',
+            'created': 0,
+            'model': 'm',
+            'choices': [
+                {
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': 'pong'},
+                    'finish_reason': 'stop',
+                }
+            ],
+        }
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=completion))
+
+        class MockedClient(httpx.Client):
+            def __init__(self, **kwargs):
+                super().__init__(transport=transport, **kwargs)
+
+        monkeypatch.setattr(httpx, 'Client', MockedClient)
+
+        client = OpenAICompatibleClient('https://pool.test/v1', 'key', 'm')
+        messages = [ChatMessage.create_message(role='user', content='ping')]
+        assert client.chat_completion(messages).get_content() == 'pong'
+
+        close_connection_pools()
+
+        assert client.chat_completion(messages).get_content() == 'pong'
+        close_connection_pools()
+
+    def test_rest_client_reports_schema_mismatch(self):
+        '''Test that valid JSON with the wrong shape is reported as a conversion error.'''
+        client = RestAPICompatibleClient('https://api.test.com/v1/chat', 'key', 'm')
+        rest_response = Mock(status_code=200, content=b'{"choices": "not a list"}')
+
+        with pytest.raises(ResponseConversionError, match='Failed to convert response'):
+            client._convert_response(rest_response)
+
+    def test_rest_client_wraps_unexpected_conversion_errors(self, monkeypatch):
+        '''Test that errors other than ValidationError still surface as APIClientError.'''
+        client = RestAPICompatibleClient('https://api.test.com/v1/chat', 'key', 'm')
+        rest_response = Mock(status_code=200, content=b'{}')
+        monkeypatch.setattr(client, '_from_json', Mock(side_effect=RuntimeError('boom')))
+
+        with pytest.raises(APIClientError, match='boom'):
+            client._convert_response(rest_response)
+
+    @staticmethod
+    def _make_streaming_client(body_lines, content_type='text/event-stream', content=b''):
+        '''Create a REST client whose session returns a canned streamed response.'''
+        stream_response = Mock(status_code=200, content=content)
+        stream_response.headers = {'Content-Type': content_type}
+        stream_response.__enter__ = Mock(return_value=stream_response)
+        stream_response.__exit__ = Mock(return_value=False)
+        stream_response.iter_lines.return_value = iter(body_lines)
+
+        client = RestAPICompatibleClient('https://api.test.com/v1/chat', 'key', 'm')
+        client._session = Mock()
+        client._session.post.return_value = stream_response
+        return client
+
+    def test_rest_client_streams_server_sent_events(self):
+        '''Test that the REST client yields content deltas from an SSE stream.'''
+        sse_lines = [
+            b': keep-alive',
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b'',
+            b'data: {"choices": [{"delta": {"content": "Hel"}}]}',
+            b'data: {"choices": [{"delta": {"content": "lo"}}]}',
+            'data: {"choices": [{"delta": {"content": " perché è così"}}]}'.encode(),
+            b'data: [DONE]',
+        ]
+        client = self._make_streaming_client(sse_lines)
+
+        messages = [ChatMessage.create_message(role='user', content='Hi')]
+        assert list(client.chat_completion_stream(messages)) == [
+            'Hel',
+            'lo',
+            ' perché è così',
+        ]
+        assert client._session.post.call_args.kwargs['stream'] is True
+
+    def test_rest_client_stream_falls_back_to_json_body(self):
+        '''Test that a plain JSON answer to a stream request is yielded whole.'''
+        body = (
+            b'{"choices": [{"index": 0, "message": {"role": "assistant", '
+            b'"content": "pong"}}]}'
+        )
+        client = self._make_streaming_client(
+            [], content_type='application/json', content=body
+        )
 
-    # Step 1: Discover providers
-    providers = manager.get_available_providers()
-    assert len(providers) > 0
+        messages = [ChatMessage.create_message(role='user', content='ping')]
+        assert list(client.chat_completion_stream(messages)) == ['pong']
+
+    def test_rest_client_stream_raises_on_error_event(self):
+        '''Test that an error event in the middle of a stream is raised.'''
+        sse_lines = [
+            b'data: {"choices": [{"delta": {"content": "Hel"}}]}',
+            b'data: {"error": {"message": "rate limit exceeded"}}',
+        ]
+        client = self._make_streaming_client(sse_lines)
+
+        messages = [ChatMessage.create_message(role='user', content='Hi')]
+        stream = client.chat_completion_stream(messages)
+        assert next(stream) == 'Hel'
+        with pytest.raises(APIClientError, match='rate limit exceeded'):
+            next(stream)
+
+    def test_rest_client_parses_completion_body(self):
+        '''Test that the REST client turns a JSON body into a response object.'''
+        client = RestAPICompatibleClient('https://api.test.com/v1/chat', 'key', 'm')
+        rest_response = Mock(status_code=200)
+        rest_response.content = (
+            b'{"id": "1", "object": "chat.completion", "created": 0, "model": "m", '
+            b'"choices": [{"index": 0, "message": {"role": "assistant", '
+            b'"content": "pong"}}]}'
+        )
 
-    # Step 2: Get configurations for a provider
-    configs = manager.get_provider_configs(providers[0])
-    assert len(configs) > 0
+        assert client._convert_response(rest_response).get_content() == 'pong'
+
+    def test_rest_client_reports_invalid_json_body(self):
+        '''Test that a malformed 200 body raises ResponseConversionError.'''
+        client = RestAPICompatibleClient('https://api.test.com/v1/chat', 'key', 'm')
+        rest_response = Mock(status_code=200, content=b'{not json', text='{not json')
+
+        with pytest.raises(ResponseConversionError, match='Failed to parse JSON'):
+            client._convert_response(rest_response)
+
+
+class TestChatClient:
+    '''Test suite for ChatClient conversation handling.'''
+
+    @staticmethod
+    def _make_client(**kwargs):
+        '''Create a ChatClient without going through provider configuration.'''
+        connection_params = {
+            'api_type': 'openai',
+            'endpoint_url': 'https://api.test.com',
+            'model_name': 'test-model',
+            'init_config_msg': 'You are a test assistant.',
+        }
+        return ChatClient(
+            token=_ChatClientToken(),
+            session_id='test_session',
+            connection_params=connection_params,
+            secret_api_key='test-key',
+            **kwargs,
+        )
 
-    # Step 3: Check supported APIs
-    apis = manager.get_supported_api(providers[0], 0)
-    assert len(apis) > 0
+    def test_max_history_bounds_chat_history(self, make_response):
+        '''Test that max_history discards whole exchanges, oldest first.'''
+        client = self._make_client(max_history=3)
+        client.compatible_client.chat_completion = Mock(
+            return_value=make_response('pong')
+        )
 
-    # Step 4: Attempt configuration (may fail without API key)
-    if 'openai' in apis:
-        try:
-            manager.configure_api(providers[0], 0, 'openai')
-            result = manager.validate_configuration()
-            # Just check it returns a boolean
-            assert isinstance(result, bool)
-        except (ValueError, FileNotFoundError, KeyError):
-            # Expected when no API key is available
-            pass
+        for i in range(3):
+            assert client.send_message(f'ping {i}') == 'pong'
+
+        assert [msg.content for msg in client._chat_history] == ['ping 2', 'pong']
+        assert client._chat_history[0].role == 'user'
+
+    def test_max_history_keeps_initial_message(self, make_response):
+        '''Test that the initial message is pinned outside the bounded window.'''
+        client = self._make_client(max_history=4)
+        client.compatible_client.chat_completion = Mock(
+            return_value=make_response('pong')
+        )
+        client.clear_chat_history()
+
+        for i in range(5):
+            client.send_message(f'ping {i}')
+
+        history = list(client._chat_history)
+        assert history[0].content == 'You are a test assistant.'
+        assert [msg.content for msg in history[1:]] == ['ping 3', 'pong', 'ping 4', 'pong']
+        assert [msg.role for msg in history[1:]] == ['user', 'assistant'] * 2
+
+    def test_send_message_async_runs_concurrently(self, make_response):
+        '''Test that gathered send_message_async calls overlap in time.'''
+        # Every provider call blocks until all three are in flight at once;
+        # run one at a time, the barrier times out and the calls return None
+        barrier = threading.Barrier(3, timeout=5)
+        clients = [self._make_client() for _ in range(3)]
+        for i, client in enumerate(clients):
+
+            def answer(messages, content=f'answer {i}'):
+                barrier.wait()
+                return make_response(content)
+
+            client.compatible_client.chat_completion = Mock(side_effect=answer)
+
+        async def ask_all():
+            return await asyncio.gather(
+                *(client.send_message_async('question') for client in clients)
+            )
+
+        assert asyncio.run(ask_all()) == ['answer 0', 'answer 1', 'answer 2']
+        assert all(len(client._chat_history) == 2 for client in clients)
+
+    def test_response_cache_reuses_identical_conversation(self, make_response):
+        '''Test that cache_responses skips the provider for a repeated conversation.'''
+        ChatClient.clear_response_cache()
+        first = self._make_client(cache_responses=True)
+        second = self._make_client(cache_responses=True)
+        uncached = self._make_client()
+        for client in (first, second, uncached):
+            client.compatible_client.chat_completion = Mock(
+                return_value=make_response('cached answer')
+            )
+
+        assert first.send_message('same question') == 'cached answer'
+        assert second.send_message('same question') == 'cached answer'
+        assert uncached.send_message('same question') == 'cached answer'
+
+        first.compatible_client.chat_completion.assert_called_once()
+        second.compatible_client.chat_completion.assert_not_called()
+        uncached.compatible_client.chat_completion.assert_called_once()
+        assert len(second._chat_history) == 2
+
+        ChatClient.clear_response_cache()
+
+    def test_send_message_logs_api_errors(self, caplog):
+        '''Test that API failures are logged and reported as a None response.'''
+        client = self._make_client()
+        client.compatible_client.chat_completion = Mock(
+            side_effect=APIClientError('provider unavailable')
+        )
+
+        with caplog.at_level(logging.WARNING, logger='unified_ai_api.api_connection'):
+            assert client.send_message('Hello') is None
+
+        assert 'provider unavailable' in caplog.text
+
+    def test_clear_chat_history_resets_to_initial_message(self, make_response):
+        '''Test that clearing history leaves only the configured initial message.'''
+        client = self._make_client()
+        client.compatible_client.chat_completion = Mock(
+            return_value=make_response('Hi there')
+        )
+        client.send_message('Hello')
+
+        client.clear_chat_history()
+
+        assert len(client._chat_history) == 1
+        assert client._chat_history[0].role == 'user'
+        assert client._chat_history[0].content == 'You are a test assistant.'
+
+    def test_iter_message_streams_and_records_response(self):
+        '''Test that iter_message yields chunks and stores the joined reply.'''
+        client = self._make_client()
+        client.compatible_client.chat_completion_stream = Mock(
+            return_value=iter(['Hello', ', ', 'world'])
+        )
+
+        chunks = list(client.iter_message('Hi'))
+
+        assert chunks == ['Hello', ', ', 'world']
+        assert client._chat_history[-2].content == 'Hi'
+        assert client._chat_history[-1].role == 'assistant'
+        assert client._chat_history[-1].content == 'Hello, world'
+
+    def test_iter_message_does_not_resend_empty_stream(self, caplog):
+        '''Test that an empty stream is logged, not silently re-requested.'''
+        client = self._make_client()
+        client.compatible_client.chat_completion_stream = Mock(return_value=iter([]))
+        client.compatible_client.chat_completion = Mock()
+
+        with caplog.at_level(logging.WARNING, logger='unified_ai_api.api_connection'):
+            assert list(client.iter_message('ping')) == []
+
+        assert 'empty response' in caplog.text
+        client.compatible_client.chat_completion.assert_not_called()
+        assert [msg.content for msg in client._chat_history] == ['ping']
+
+    def test_closed_client_rejects_further_use(self):
+        '''Test that a closed client raises instead of sending messages.'''
+        client = self._make_client()
+        client.close()
+
+        with pytest.raises(APIClientError, match='closed'):
+            client.send_message('Hello')
+        with pytest.raises(APIClientError, match='closed'):
+            client.clear_chat_history()
+
+    def test_invalid_max_history_rejected(self):
+        '''Test that a max_history too small for one exchange is rejected.'''
+        with pytest.raises(InvalidParameterError):
+            self._make_client(max_history=0)
+        with pytest.raises(InvalidParameterError, match='at least 2'):
+            self._make_client(max_history=1)
+
+
+# Integration tests
+def test_end_to_end_workflow(manager, providers, fake_keys, make_response):
+    '''Test configuring a discovered provider and chatting through it.'''
+    # Discovery itself is covered by test_api_connection_manager_full_workflow
+    provider = providers[0]
+    api_type = manager.get_supported_api(provider, 0)[0]
+
+    manager.configure_api(provider, 0, api_type)
+    assert manager.validate_configuration()
+
+    with manager.create_chatclient() as client:
+        client.compatible_client.chat_completion = Mock(
+            return_value=make_response('pong')
+        )
+        assert client.send_message('ping') == 'pong'
 
-    # Step 5: Check final state
-    params = manager.get_connection_params()
-    assert isinstance(params, dict)
+    assert manager.get_connection_params()['provider'] == provider
 
 
 if __name__ == '__main__':